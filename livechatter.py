@@ -16,11 +16,16 @@ from __future__ import annotations
 
 import sys
 import os
+import collections
+import functools
+import itertools
 import json
+import hashlib
 import re
+import queue
 import threading
 import time
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 import urllib.request, urllib.error, urllib.parse
 
 # -------- Optional imports with graceful fallbacks --------
@@ -66,19 +71,12 @@ except ImportError:
     requests = None
 
 try:
-    from google.cloud import texttospeech as gcloud_tts
+    import orjson
 except ImportError:
-    gcloud_tts = None
+    orjson = None
 
-try:
-    import boto3
-except ImportError:
-    boto3 = None
-
-try:
-    import elevenlabs
-except ImportError:
-    elevenlabs = None
+# boto3 and elevenlabs are imported on first use in the voice helpers below;
+# they add noticeable startup time for users who never pick those providers.
 
 from PyQt6 import QtWidgets, QtCore, QtGui, QtMultimedia
 
@@ -110,6 +108,8 @@ SYSTEM_TTS_ENGINES = [
     "Screen reader (Auto)",
 ]
 
+CHAT_HISTORY_MAX = 5000  # rows kept in the chat history list
+
 DEFAULT_CONFIG = {
     "openai_api_key": "",
     "google_cloud_tts_api_key": "",
@@ -125,6 +125,8 @@ DEFAULT_CONFIG = {
     "system_tts_backend": SYSTEM_TTS_ENGINES[0],
     "summary_interval_minutes": 5,
     "quick_summary_count": 50,
+    "tts_max_backlog": 5,  # queued utterances before ordinary chat stops being read
+    "chat_sound_min_interval_ms": 150,  # minimum gap between plain chat sounds during bursts
     # Window state
     "window_x": None,
     "window_y": None,
@@ -143,8 +145,12 @@ def load_config() -> Dict[str, Any]:
     cfg = DEFAULT_CONFIG.copy()
     if os.path.exists(CONFIG_PATH):
         try:
-            with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                loaded = json.load(f)
+            if orjson is not None:
+                with open(CONFIG_PATH, "rb") as f:
+                    loaded = orjson.loads(f.read())
+            else:
+                with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+                    loaded = json.load(f)
             cfg.update(loaded)
         except (json.JSONDecodeError, IOError):
             pass
@@ -152,21 +158,50 @@ def load_config() -> Dict[str, Any]:
 
 def save_config(cfg: Dict[str, Any]):
     ensure_config_dir()
-    with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-        json.dump(cfg, f, indent=2)
+    # Write to a temp file and swap it in so a crash never leaves half-written JSON
+    tmp_path = CONFIG_PATH + ".tmp"
+    if orjson is not None:
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(cfg, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cfg, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, CONFIG_PATH)
 
 # ----------------- Sound Management -----------------
+@functools.lru_cache(maxsize=1)
+def list_sound_packs() -> List[str]:
+    # Cached for the session; call list_sound_packs.cache_clear() to pick up new packs.
+    try:
+        with os.scandir(SOUND_DIR) as it:
+            return ["None", *sorted(e.name for e in it if e.is_dir(follow_symlinks=False))]
+    except OSError:
+        return ["None"]
+
 class SoundManager:
     SOUND_FILES = ["chat", "donation", "error", "moderator", "start", "stop", "summary", "verified"]
+    # Played per chat message, so decode them up front; the rest load on first play
+    PRELOAD_SOUNDS = ["chat", "donation", "moderator", "verified"]
 
     def __init__(self, cfg: Dict[str, Any]):
         self.cfg = cfg
-        self._effects: Dict[str, QtMultimedia.QSoundEffect] = {}
+        # name -> wav path, and name -> loaded effect
+        self._effects: Dict[str, str] = {}
+        self._effects_cache: Dict[str, QtMultimedia.QSoundEffect] = {}
+        self._pack_name = self.cfg.get("sound_pack", "None")
         self.load_pack()
 
+    def update_config(self, cfg: Dict[str, Any]):
+        self.cfg = cfg
+        pack_name = cfg.get("sound_pack", "None")
+        if pack_name != self._pack_name:
+            self._pack_name = pack_name
+            self.load_pack()
+
     def load_pack(self):
         self._effects = {}
-        pack_name = self.cfg.get("sound_pack", "None")
+        self._effects_cache = {}
+        pack_name = self._pack_name
         if pack_name == "None":
             return
         
@@ -177,31 +212,44 @@ class SoundManager:
         for name in self.SOUND_FILES:
             sound_path = os.path.join(pack_path, f"{name}.wav")
             if os.path.exists(sound_path):
-                effect = QtMultimedia.QSoundEffect()
-                effect.setSource(QtCore.QUrl.fromLocalFile(sound_path))
-                self._effects[name] = effect
+                self._effects[name] = sound_path
+        for name in self.PRELOAD_SOUNDS:
+            self._effect(name)
+
+    def _effect(self, sound_name: str) -> Optional[QtMultimedia.QSoundEffect]:
+        effect = self._effects_cache.get(sound_name)
+        if effect is None:
+            sound_path = self._effects.get(sound_name)
+            if sound_path is None:
+                return None
+            effect = QtMultimedia.QSoundEffect()
+            effect.setSource(QtCore.QUrl.fromLocalFile(sound_path))
+            self._effects_cache[sound_name] = effect
+        return effect
 
     def play(self, sound_name: str):
-        if sound_name in self._effects:
-            self._effects[sound_name].play()
+        effect = self._effect(sound_name)
+        if effect is not None:
+            effect.play()
 
 # ----------------- Utilities -----------------
+_ID_RE = re.compile(r"[A-Za-z0-9_-]{11}")
+_URL_RE = re.compile(r"(?:youtu\.be/|v=|live/)([A-Za-z0-9_-]{11})")
+
 def extract_youtube_video_id(url_or_id: str) -> Optional[str]:
     s = url_or_id.strip()
-    if re.fullmatch(r"[A-Za-z0-9_-]{11}", s):
+    if _ID_RE.fullmatch(s):
         return s
-    for p in [r"youtu\.be/([A-Za-z0-9_-]{11})", r"v=([A-Za-z0-9_-]{11})", r"live/([A-Za-z0-9_-]{11})"]:
-        m = re.search(p, s)
-        if m:
-            return m.group(1)
-    return None
+    m = _URL_RE.search(s)
+    return m.group(1) if m else None
 
 # ----------------- Native stderr suppression (for noisy SAPI/eSpeak outputs) -----------------
+_DEVNULL_FD = os.open(os.devnull, os.O_WRONLY)
+
 class _SuppressStderrFD:
     def __enter__(self):
-        self._null = open(os.devnull, 'w')
         self._stderr_fd = os.dup(2)
-        os.dup2(self._null.fileno(), 2)
+        os.dup2(_DEVNULL_FD, 2)
         return self
     def __exit__(self, exc_type, exc, tb):
         try:
@@ -211,30 +259,40 @@ class _SuppressStderrFD:
                 os.close(self._stderr_fd)
             except Exception:
                 pass
-            try:
-                self._null.close()
-            except Exception:
-                pass
 
 # ----------------- TTS (System primary; cloud stubs) -----------------
+# Installed voices don't change during a session, so enumerate them once.
+_sapi5_voice_cache: Optional[List[str]] = None
+
 class TTSManager:
     def __init__(self, cfg: Dict[str, Any]):
         self.cfg = cfg
         self.system_out = None
+        self._speak_q: Optional[queue.Queue] = None
+        self._speak_thread: Optional[threading.Thread] = None
+        self._backend = self.cfg.get("system_tts_backend", SYSTEM_TTS_ENGINES[0])
         self._init_system_tts()
 
+    def update_config(self, cfg: Dict[str, Any]):
+        # Voice/provider are read from cfg on every speak; only a backend switch needs a rebuild
+        self.cfg = cfg
+        backend = cfg.get("system_tts_backend", SYSTEM_TTS_ENGINES[0])
+        if backend != self._backend:
+            self.shutdown()
+            self.system_out = None
+            self._backend = backend
+            self._init_system_tts()
+
     def _init_system_tts(self):
-        choice = self.cfg.get("system_tts_backend", SYSTEM_TTS_ENGINES[0])
+        choice = self._backend
         if choice.startswith("SAPI5"):
             if win32 is not None and pythoncom is not None and sys.platform.startswith("win"):
                 self.system_out = "SAPI5_DIRECT"
+                self._speak_q = queue.Queue()
+                self._speak_thread = threading.Thread(target=self._sapi5_worker, args=(self._speak_q,), daemon=True)
+                self._speak_thread.start()
                 return
-            if sapi5 is not None:
-                try:
-                    self.system_out = sapi5.SAPI5()
-                    return
-                except Exception:
-                    self.system_out = None
+            self._init_ao2_sapi5()
             return
         if AO2Auto is not None:
             try:
@@ -242,10 +300,32 @@ class TTSManager:
             except Exception:
                 self.system_out = None
 
+    def _init_ao2_sapi5(self):
+        self.system_out = None
+        if sapi5 is not None:
+            try:
+                self.system_out = sapi5.SAPI5()
+            except Exception:
+                self.system_out = None
+
+    def _sapi5_direct_ready(self) -> bool:
+        if self._speak_q is not None and self._speak_thread is not None and self._speak_thread.is_alive():
+            return True
+        if self.system_out == "SAPI5_DIRECT":
+            # The speaker thread exits if COM init or the SpVoice dispatch fails;
+            # fall back to accessible_output2's SAPI5 instead of queueing forever.
+            self._speak_q = None
+            self._speak_thread = None
+            self._init_ao2_sapi5()
+        return False
+
     @staticmethod
     def list_sapi5_voices() -> List[str]:
+        global _sapi5_voice_cache
         if not (win32 and pythoncom and sys.platform.startswith("win")):
             return []
+        if _sapi5_voice_cache is not None:
+            return list(_sapi5_voice_cache)
         names: List[str] = []
         try:
             pythoncom.CoInitialize()
@@ -260,42 +340,87 @@ class TTSManager:
                 pythoncom.CoUninitialize()
             except Exception:
                 pass
-        return names
+        if names:
+            _sapi5_voice_cache = names
+        return list(names)
 
     @staticmethod
-    def _sapi5_say(text: str, voice_desc: str | None):
-        def _run():
-            try:
-                pythoncom.CoInitialize()
-                sp = win32.Dispatch("SAPI.SpVoice")
-                if voice_desc:
+    def _sapi5_worker(q: queue.Queue):
+        # One COM apartment and SpVoice for the lifetime of the manager; utterances are queued.
+        try:
+            pythoncom.CoInitialize()
+        except Exception:
+            return
+        try:
+            sp = win32.Dispatch("SAPI.SpVoice")
+            default_voice = sp.Voice
+            active_voice: str | None = None
+            while True:
+                item = q.get()
+                if item is None:
+                    break
+                text, voice_desc = item
+                if voice_desc != active_voice:
                     try:
-                        toks = sp.GetVoices()
-                        for i in range(toks.Count):
-                            tok = toks.Item(i)
-                            if tok.GetDescription() == voice_desc:
-                                sp.Voice = tok
-                                break
+                        if not voice_desc:
+                            sp.Voice = default_voice
+                            active_voice = None
+                        else:
+                            toks = sp.GetVoices()
+                            for i in range(toks.Count):
+                                tok = toks.Item(i)
+                                if tok.GetDescription() == voice_desc:
+                                    sp.Voice = tok
+                                    break
+                            else:
+                                sp.Voice = default_voice  # voice not installed
+                            # Remember the request either way so a missing voice isn't looked up per utterance
+                            active_voice = voice_desc
                     except Exception:
                         pass
-                with _SuppressStderrFD():
-                    sp.Speak(text, 0)
-            except Exception:
-                pass
-            finally:
                 try:
-                    pythoncom.CoUninitialize()
+                    with _SuppressStderrFD():
+                        sp.Speak(text, 0)
                 except Exception:
                     pass
-        th = threading.Thread(target=_run, daemon=True)
-        th.start()
+        except Exception:
+            pass
+        finally:
+            try:
+                pythoncom.CoUninitialize()
+            except Exception:
+                pass
+
+    def _sapi5_say(self, text: str, voice_desc: str | None):
+        if self._sapi5_direct_ready():
+            self._speak_q.put((text, voice_desc))
+
+    def backlog(self) -> int:
+        # Utterances waiting behind the one currently being spoken
+        return self._speak_q.qsize() if self._sapi5_direct_ready() else 0
+
+    def trim_backlog(self, limit: int):
+        # Drop the oldest queued utterances until at most `limit` remain
+        if not self._sapi5_direct_ready():
+            return
+        while self._speak_q.qsize() > max(0, limit):
+            try:
+                self._speak_q.get_nowait()
+            except queue.Empty:
+                break
+
+    def shutdown(self):
+        if self._speak_q is not None:
+            self._speak_q.put(None)
+            self._speak_q = None
+            self._speak_thread = None
 
     def speak(self, text: str):
         tts_opt = self.cfg.get("tts_option", TTS_OPTIONS[0])
         if tts_opt == "System (screen reader/SAPI5)":
             backend = self.cfg.get("system_tts_backend", SYSTEM_TTS_ENGINES[0])
             if backend.startswith("SAPI5"):
-                if self.system_out == "SAPI5_DIRECT":
+                if self.system_out == "SAPI5_DIRECT" and self._sapi5_direct_ready():
                     self._sapi5_say(text, self.cfg.get("tts_voice") or None)
                     return
                 if self.system_out:
@@ -317,6 +442,66 @@ class TTSManager:
         print(f"[{tts_opt} stub]", text)
 
 # ---- Voice listing helpers for cloud TTS providers ----
+def _make_http_session():
+    if requests is None:
+        return None
+    from urllib3.util.retry import Retry  # always installed alongside requests
+    session = requests.Session()
+    session.mount("https://", requests.adapters.HTTPAdapter(
+        pool_connections=4, pool_maxsize=8, max_retries=Retry(total=2, backoff_factor=0.3)))
+    return session
+
+# Shared keep-alive session so repeated voice refreshes skip the TLS handshake
+_http = _make_http_session()
+
+# Cloud voice lists, keyed by provider + a digest of the credentials, persisted
+# next to the config so reopening the app doesn't re-hit every provider.
+VOICE_CACHE_PATH = os.path.join(CONFIG_DIR, "voice_cache.json")
+VOICE_CACHE_TTL = 24 * 3600  # seconds
+_voice_cache: Dict[str, tuple[float, list]] = {}
+_voice_cache_lock = threading.Lock()
+
+def _voice_cache_key(provider: str, *creds: str) -> str:
+    return provider + ":" + hashlib.sha256("\0".join(creds).encode("utf-8")).hexdigest()
+
+def _voice_cache_get(key: str) -> Optional[list]:
+    cached = _voice_cache.get(key)
+    if cached and time.time() - cached[0] < VOICE_CACHE_TTL:
+        # JSON round-trips tuples as lists
+        return [tuple(v) if isinstance(v, list) else v for v in cached[1]]
+    return None
+
+def _voice_cache_put(key: str, voices: list):
+    with _voice_cache_lock:
+        _voice_cache[key] = (time.time(), voices)
+        save_voice_cache()
+
+def load_voice_cache():
+    try:
+        with open(VOICE_CACHE_PATH, "r", encoding="utf-8") as f:
+            loaded = json.load(f)
+        if not isinstance(loaded, dict):
+            return
+        _voice_cache.update({k: (float(ts), list(v)) for k, (ts, v) in loaded.items()})
+    except (OSError, ValueError, TypeError):
+        pass
+
+def save_voice_cache():
+    try:
+        tmp_path = VOICE_CACHE_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(_voice_cache, f, ensure_ascii=False)
+        os.replace(tmp_path, VOICE_CACHE_PATH)
+    except OSError:
+        pass
+
+def clear_voice_cache():
+    global _sapi5_voice_cache
+    with _voice_cache_lock:
+        _sapi5_voice_cache = None
+        _voice_cache.clear()
+        save_voice_cache()
+
 
 def list_openai_tts_voices() -> List[str]:
     return ["alloy", "echo", "fable", "onyx", "nova", "shimmer"]
@@ -324,38 +509,82 @@ def list_openai_tts_voices() -> List[str]:
 def list_gcloud_tts_voices(api_key: str) -> List[tuple[str, str]]:
     if not api_key:
         return []
+    cache_key = _voice_cache_key("gcloud", api_key)
+    cached = _voice_cache_get(cache_key)
+    if cached is not None:
+        return cached
     try:
         url = "https://texttospeech.googleapis.com/v1/voices?key=" + urllib.parse.quote(api_key)
-        with urllib.request.urlopen(url, timeout=10) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
+        if _http is not None:
+            resp = _http.get(url, timeout=10)
+            resp.raise_for_status()
+            data = resp.json()
+        else:
+            with urllib.request.urlopen(url, timeout=10) as resp:
+                data = json.loads(resp.read().decode("utf-8"))
         out: List[tuple[str, str]] = []
         for v in data.get("voices", []):
             name = v.get("name", "")
             langs = ",".join(v.get("languageCodes", []) or [])
             if name:
                 out.append((name, langs))
-        return out
+        if out:
+            _voice_cache_put(cache_key, out)
+        return list(out)
     except Exception:
         return []
 
-def list_polly_voices(aws_key: str, aws_secret: str, region: str) -> List[str]:
-    if not (boto3 and aws_key and aws_secret and region):
-        return []
-    try:
+_polly_clients: Dict[str, Any] = {}
+
+def _polly_client(aws_key: str, aws_secret: str, region: str):
+    # Reused per credentials so botocore keeps its connection pool between reloads
+    key = _voice_cache_key("polly", aws_key, aws_secret, region)
+    client = _polly_clients.get(key)
+    if client is None:
+        try:
+            import boto3
+            from botocore.config import Config
+        except ImportError:
+            return None
         client = boto3.client(
             "polly",
             region_name=region,
             aws_access_key_id=aws_key,
             aws_secret_access_key=aws_secret,
+            config=Config(connect_timeout=5, read_timeout=10, retries={"max_attempts": 2}),
         )
+        _polly_clients[key] = client
+    return client
+
+def list_polly_voices(aws_key: str, aws_secret: str, region: str) -> List[str]:
+    if not (aws_key and aws_secret and region):
+        return []
+    cache_key = _voice_cache_key("polly", aws_key, aws_secret, region)
+    cached = _voice_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    try:
+        client = _polly_client(aws_key, aws_secret, region)
+        if client is None:
+            return []
         resp = client.describe_voices()
-        voices = [v.get("Id") for v in resp.get("Voices", []) if v.get("Id")]
-        return sorted(set(voices))
+        voices = sorted({v.get("Id") for v in resp.get("Voices", []) if v.get("Id")})
+        if voices:
+            _voice_cache_put(cache_key, voices)
+        return list(voices)
     except Exception:
         return []
 
 def list_elevenlabs_voices(api_key: str) -> List[tuple[str, str]]:
-    if not (elevenlabs and api_key):
+    if not api_key:
+        return []
+    cache_key = _voice_cache_key("elevenlabs", api_key)
+    cached = _voice_cache_get(cache_key)
+    if cached is not None:
+        return cached
+    try:
+        import elevenlabs
+    except ImportError:
         return []
     try:
         if hasattr(elevenlabs, "set_api_key"):
@@ -368,44 +597,75 @@ def list_elevenlabs_voices(api_key: str) -> List[tuple[str, str]]:
             vid = getattr(v, "voice_id", "")
             if name and vid:
                 out.append((str(name), str(vid)))
-        return out
+        if out:
+            _voice_cache_put(cache_key, out)
+        return list(out)
     except Exception:
         return []
 
 # ----------------- Summarizer -----------------
+SUMMARY_MODEL = "gpt-3.5-turbo"
+SUMMARY_CACHE_TTL = 600  # seconds a cached summary stays valid for an identical transcript
+SUMMARY_CACHE_SIZE = 64
+# Sentence boundary in streamed output: terminal punctuation followed by whitespace
+# (skipping common honorifics), or a line break.
+_SENTENCE_END_RE = re.compile(r"(?<!\bMr)(?<!\bMrs)(?<!\bMs)(?<!\bDr)(?<!\bSt)(?<!\bvs)[.!?]+\s+|\n+")
+
+# Kept byte-identical across calls so the provider can cache the prompt prefix;
+# only the transcript in the user message varies.
+SUMMARY_SYSTEM_PROMPT = (
+    "You are a witty and humorous assistant summarizing a YouTube live stream chat. "
+    "Your summary will be read out loud by a text-to-speech engine, so adopt a conversational and slightly comedic tone. "
+    "Be concise and keep your summary to a few sentences.\n\n"
+    "If the chat activity is quiet: make a brief, funny comment about the silence, "
+    "and then just read out the few messages that have appeared.\n\n"
+    "If the chat activity is active: do not list every message. Instead, capture the main vibe. "
+    "Identify the key topics being discussed, mention any highlights or funny moments, "
+    "and give a general sense of the conversation."
+)
+
 class Summarizer:
     def __init__(self, cfg: Dict[str, Any]):
         self.cfg = cfg
+        # Reused across calls so HTTP keep-alive survives between summaries
+        self._client = None
+        self._client_key: Optional[str] = None
+        # transcript hash -> (timestamp, summary); insertion order doubles as age order
+        self._resp_cache: Dict[str, tuple[float, str]] = {}
+
+    def update_config(self, cfg: Dict[str, Any]):
+        # The client is rebuilt lazily only if the API key changed
+        self.cfg = cfg
 
-    def summarize(self, messages: List[Dict[str, str]]) -> str:
-        if not messages:
-            return "It's been quiet. No new messages to summarize."
-
-        formatted_chat = "\n".join([f"{m.get('author', 'User')}: {m.get('text', '')}" for m in messages])
-        
-        base_prompt = (
-            "You are a witty and humorous assistant summarizing a YouTube live stream chat. "
-            "Your summary will be read out loud by a text-to-speech engine, so adopt a conversational and slightly comedic tone. "
-            "Be concise and keep your summary to a few sentences."
-        )
+    def summarize(self, messages: List[Dict[str, str]], on_sentence: Optional[Callable[[str], None]] = None,
+                  should_stop: Optional[Callable[[], bool]] = None) -> str:
+        # When on_sentence is given, the summary is also fed to it sentence by sentence as
+        # it streams in (or whole, for cached/error results) so TTS can start right away.
+        # should_stop is polled between streamed chunks to abandon the request early.
+        delivered = False
+        def deliver(sentence: str):
+            nonlocal delivered
+            delivered = True
+            on_sentence(sentence)
 
-        if len(messages) < 5:
-            task_prompt = (
-                "The chat is very quiet. Make a brief, funny comment about the silence, "
-                "and then just read out the few messages that have appeared."
-            )
+        if not messages:
+            summary = "It's been quiet. No new messages to summarize."
         else:
-            task_prompt = (
-                "The chat is active. Do not list every message. Instead, capture the main vibe. "
-                "Identify the key topics being discussed, mention any highlights or funny moments, "
-                "and give a general sense of the conversation."
-            )
-        
-        full_prompt = f"{base_prompt}\n\n{task_prompt}\n\nHere are the recent messages:\n{formatted_chat}"
-
-        return self._summarize_with_openai(full_prompt)
-
-    def _summarize_with_openai(self, prompt_text: str) -> str:
+            get = dict.get
+            formatted_chat = "\n".join(f"{get(m, 'author', 'User')}: {get(m, 'text', '')}" for m in messages)
+            
+            activity = "quiet" if len(messages) < 5 else "active"
+            user_prompt = f"Chat activity: {activity} ({len(messages)} messages).\n\nHere are the recent messages:\n{formatted_chat}"
+
+            summary = self._summarize_with_openai(user_prompt, deliver if on_sentence else None, should_stop)
+        if should_stop and should_stop():
+            return summary
+        if on_sentence and not delivered:
+            on_sentence(summary)
+        return summary
+
+    def _summarize_with_openai(self, prompt_text: str, on_sentence: Optional[Callable[[str], None]] = None,
+                               should_stop: Optional[Callable[[], bool]] = None) -> str:
         if not openai:
             return "(OpenAI library not installed. Please run: pip install openai)"
         
@@ -413,28 +673,77 @@ class Summarizer:
         if not api_key:
             return "(OpenAI API key is not set in Options)"
 
+        key = hashlib.blake2b(f"{SUMMARY_MODEL}\0{prompt_text}".encode("utf-8"), digest_size=16).hexdigest()
+        cached = self._resp_cache.get(key)
+        if cached and time.time() - cached[0] < SUMMARY_CACHE_TTL:
+            return cached[1]
+
         try:
-            client = openai.OpenAI(api_key=api_key)
-            response = client.chat.completions.create(
-                model="gpt-3.5-turbo",
+            if self._client is None or self._client_key != api_key:
+                self._client = openai.OpenAI(api_key=api_key)
+                self._client_key = api_key
+            stream = self._client.chat.completions.create(
+                model=SUMMARY_MODEL,
                 messages=[
-                    {"role": "system", "content": "You are a helpful and witty assistant for summarizing YouTube chat."},
+                    {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt_text}
                 ],
                 temperature=0.7,
                 max_tokens=150,
+                stream=True,
+                timeout=30,
             )
-            summary = response.choices[0].message.content
-            return summary.strip() if summary else "(OpenAI returned an empty summary)"
+            parts: List[str] = []
+            pending = ""
+            for chunk in stream:
+                if should_stop and should_stop():
+                    stream.close()
+                    return "(Summary cancelled)"
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                parts.append(delta)
+                if on_sentence:
+                    # Only split once whitespace follows the punctuation, so "$3.50" or a
+                    # "." token still waiting for its next delta isn't cut mid-sentence.
+                    pending += delta
+                    end = 0
+                    for m in _SENTENCE_END_RE.finditer(pending):
+                        sentence = pending[end:m.end()].strip()
+                        if sentence:
+                            on_sentence(sentence)
+                        end = m.end()
+                    pending = pending[end:]
+            if on_sentence and pending.strip():
+                on_sentence(pending.strip())
+            summary = "".join(parts)
+            if not summary.strip():
+                return "(OpenAI returned an empty summary)"
+            summary = summary.strip()
+            self._resp_cache.pop(key, None)
+            self._resp_cache[key] = (time.time(), summary)
+            while len(self._resp_cache) > SUMMARY_CACHE_SIZE:
+                del self._resp_cache[next(iter(self._resp_cache))]
+            return summary
         except Exception as e:
             return f"(OpenAI API error: {e})"
 
 # ----------------- Chat Reader Thread -----------------
+# Message types that always get their own sound, regardless of the author's role
+_MSG_SOUND = {"superChat": "donation", "superSticker": "donation"}
+
 class ChatReader(QtCore.QThread):
-    message_received = QtCore.pyqtSignal(dict)
+    messages_received_batch = QtCore.pyqtSignal(list)
     error_message = QtCore.pyqtSignal(str)
     stopped = QtCore.pyqtSignal()
 
+    # Each pytchat get() is an HTTP request to YouTube, so never poll faster than
+    # the old fixed rate or the wait YouTube suggests (chat_data.interval).
+    POLL_MIN = 0.5  # seconds
+    POLL_MAX = 2.0
+
     def __init__(self, video_id: str, parent=None):
         super().__init__(parent)
         self.video_id = video_id
@@ -446,18 +755,26 @@ class ChatReader(QtCore.QThread):
                 chat = None
                 try:
                     chat = pytchat.create(video_id=self.video_id, interruptable=False)
+                    interval = self.POLL_MIN
                     while chat.is_alive() and not self._stop.is_set():
-                        for c in chat.get().items:
+                        batch = []
+                        data = chat.get()
+                        for c in data.items:
                             if self._stop.is_set(): break
-                            msg = {
+                            batch.append(self._prepare({
                                 "author": c.author.name, 
                                 "text": c.message,
                                 "type": c.type,
                                 "is_moderator": c.author.isChatModerator,
                                 "is_verified": c.author.isVerified 
-                            }
-                            self.message_received.emit(msg)
-                        time.sleep(0.5)
+                            }))
+                        if batch:
+                            self.messages_received_batch.emit(batch)
+                        # Hold the base rate while chat is flowing, back off only when polls come back empty
+                        yt_interval = float(getattr(data, "interval", 0) or 0)
+                        interval = self.POLL_MIN if batch else min(interval * 1.5, self.POLL_MAX)
+                        interval = max(interval, yt_interval)
+                        if self._stop.wait(interval): break
                     if self._stop.is_set(): break
                     self.error_message.emit("Chat connection lost. Reconnecting in 10 seconds...")
                 except Exception as e:
@@ -466,8 +783,8 @@ class ChatReader(QtCore.QThread):
                     if chat:
                         try: chat.terminate()
                         except: pass
-                if not self._stop.is_set():
-                    time.sleep(10)
+                # Returns immediately if stop() is called during the reconnect delay
+                self._stop.wait(10)
             self.stopped.emit()
             return
 
@@ -483,7 +800,7 @@ class ChatReader(QtCore.QThread):
                             "text": msg.get("message", ""), "type": "textMessage",
                             "is_moderator": False, "is_verified": False
                         }
-                        self.message_received.emit(m)
+                        self.messages_received_batch.emit([self._prepare(m)])
             except Exception as e:
                 emsg = str(e)
                 if "disabled" in emsg.lower():
@@ -495,9 +812,92 @@ class ChatReader(QtCore.QThread):
             self.error_message.emit("No chat backend is available. Install 'pytchat' or 'chat-downloader'.")
             self.stopped.emit()
 
+    @staticmethod
+    def _prepare(msg: Dict[str, Any]) -> Dict[str, Any]:
+        # Format and classify here so the GUI thread only has to display and play
+        msg["display"] = f"{msg['author']}: {msg['text']}"
+        msg["sound"] = _MSG_SOUND.get(msg["type"]) or (
+            "moderator" if msg["is_moderator"] else "verified" if msg["is_verified"] else "chat")
+        return msg
+
     def stop(self):
         self._stop.set()
 
+# ----------------- Voice List Worker -----------------
+class VoiceListWorker(QtCore.QObject):
+    """Enumerates voices for a TTS provider off the GUI thread (SAPI5 COM or cloud HTTP)."""
+    # (provider, [(display text, voice id or None for placeholders)])
+    voices_ready = QtCore.pyqtSignal(str, list)
+
+    def __init__(self, cfg: Dict[str, Any], opt: str, system_engine: str):
+        super().__init__()
+        self.cfg = cfg
+        self.opt = opt
+        self.system_engine = system_engine
+
+    def start(self):
+        # A daemon thread rather than a QThread: some provider SDKs have no timeout, and a
+        # stuck lookup must neither block closing the window nor abort Qt at exit.
+        # The thread holds the only reference to the worker until it finishes.
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _run(self):
+        items: List[tuple[str, Optional[str]]] = []
+        opt = self.opt
+        if opt == "System (screen reader/SAPI5)":
+            if self.system_engine.startswith("SAPI5") and sys.platform.startswith("win"):
+                items = [(v, v) for v in TTSManager.list_sapi5_voices()]
+                if not items: items = [("(No SAPI5 voices found)", None)]
+            else:
+                items = [("(Voice controlled by screen reader)", None)]
+        elif opt == "OpenAI TTS":
+            items = [(v, v) for v in list_openai_tts_voices()]
+        elif opt == "Google Cloud TTS":
+            key = self.cfg.get("google_cloud_tts_api_key", "")
+            if key:
+                voices = list_gcloud_tts_voices(key)
+                if voices:
+                    items = [(f"{name} [{langs}]" if langs else name, name) for name, langs in voices]
+                else: items = [("(No voices found; check API key)", None)]
+            else: items = [("(API key required in Options)", None)]
+        elif opt == "Amazon Polly":
+            items = [(v, v) for v in list_polly_voices(
+                self.cfg.get("aws_access_key_id", ""),
+                self.cfg.get("aws_secret_access_key", ""),
+                self.cfg.get("aws_region", "us-east-1"),
+            )]
+            if not items: items = [("(AWS keys/region required in Options)", None)]
+        elif opt == "ElevenLabs":
+            key = self.cfg.get("elevenlabs_api_key", "")
+            if key:
+                pairs = list_elevenlabs_voices(key)
+                if pairs:
+                    items = pairs
+                else: items = [("(No voices found; check API key)", None)]
+            else: items = [("(API key required in Options)", None)]
+        else:
+            items = [("(Select a TTS provider)", None)]
+        try:
+            self.voices_ready.emit(opt, items)
+        except RuntimeError:
+            pass  # the app is shutting down
+
+# ----------------- Summary Worker -----------------
+class SummaryWorker(QtCore.QThread):
+    """Runs a summary request off the GUI thread, emitting sentences as they stream in."""
+    chunk = QtCore.pyqtSignal(str)
+    done = QtCore.pyqtSignal(str)
+
+    def __init__(self, summarizer: Summarizer, messages: List[Dict[str, str]], parent=None):
+        super().__init__(parent)
+        self.summarizer = summarizer
+        self.messages = messages
+
+    def run(self):
+        summary = self.summarizer.summarize(self.messages, on_sentence=self.chunk.emit,
+                                            should_stop=self.isInterruptionRequested)
+        self.done.emit(summary)
+
 # ----------------- Options Dialog -----------------
 class OptionsDialog(QtWidgets.QDialog):
     def __init__(self, cfg: Dict[str, Any], parent=None):
@@ -532,10 +932,16 @@ class OptionsDialog(QtWidgets.QDialog):
         self.eleven_key.setEchoMode(QtWidgets.QLineEdit.EchoMode.Password)
         layout.addRow("ElevenLabs API key:", self.eleven_key)
 
+        sound_row = QtWidgets.QHBoxLayout()
         self.sound_pack_combo = QtWidgets.QComboBox()
         self.sound_pack_combo.addItems(list_sound_packs())
         self.sound_pack_combo.setCurrentText(self.cfg.get("sound_pack", "Default"))
-        layout.addRow("Sound pack:", self.sound_pack_combo)
+        sound_row.addWidget(self.sound_pack_combo, 1)
+        self.refresh_packs_btn = QtWidgets.QPushButton("&Refresh")
+        self.refresh_packs_btn.setToolTip("Rescan the sounds folder for new packs")
+        self.refresh_packs_btn.clicked.connect(self._refresh_sound_packs)
+        sound_row.addWidget(self.refresh_packs_btn)
+        layout.addRow("Sound pack:", sound_row)
 
         btns = QtWidgets.QDialogButtonBox(
             QtWidgets.QDialogButtonBox.StandardButton.Save | QtWidgets.QDialogButtonBox.StandardButton.Cancel
@@ -545,6 +951,13 @@ class OptionsDialog(QtWidgets.QDialog):
         layout.addRow(btns)
         self.setMinimumWidth(500)
 
+    def _refresh_sound_packs(self):
+        current = self.sound_pack_combo.currentText()
+        list_sound_packs.cache_clear()
+        self.sound_pack_combo.clear()
+        self.sound_pack_combo.addItems(list_sound_packs())
+        self.sound_pack_combo.setCurrentText(current)
+
     def get_updated_config(self) -> Dict[str, Any]:
         newcfg = self.cfg.copy()
         newcfg.update({
@@ -563,15 +976,24 @@ class MainWindow(QtWidgets.QMainWindow):
     def __init__(self):
         super().__init__()
         self.cfg = load_config()
+        load_voice_cache()
+        self._cfg_dirty = False
+        self._save_timer = QtCore.QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self._flush_config)
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self._flush_config)
         self.setWindowTitle(APP_NAME)
         self._restore_window_geometry()
 
         self.tts = TTSManager(self.cfg)
         self.sound_manager = SoundManager(self.cfg)
         self.summarizer = Summarizer(self.cfg)
-        self.pending_messages: List[Dict[str, str]] = []
-        self.last_summary_ts = time.time()
+        # Bounded so a multi-hour stream can't grow this without limit
+        self.pending_messages: collections.deque[Dict[str, str]] = collections.deque(
+            maxlen=self._pending_maxlen(int(self.cfg.get("quick_summary_count", 50))))
         self.reader: Optional[ChatReader] = None
+        self._summary_worker: Optional[SummaryWorker] = None  # set while a summary is in flight
+        self._last_chat_sound = 0.0
 
         central = QtWidgets.QWidget()
         self.setCentralWidget(central)
@@ -589,6 +1011,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.chat_mode.addItems(CHAT_MODES)
         self.chat_mode.setCurrentText(self.cfg.get("chat_mode", CHAT_MODES[0]))
         self.chat_mode.currentTextChanged.connect(self._update_cfg)
+        self._chat_mode_idx = self.chat_mode.currentIndex()  # read per message; avoids a Qt round-trip
+        self.chat_mode.currentIndexChanged.connect(self._on_chat_mode_changed)
         gl.addWidget(self.chat_mode, 1, 1, 1, 3)
 
         # Row 2: TTS Options
@@ -611,8 +1035,13 @@ class MainWindow(QtWidgets.QMainWindow):
         self.voice_combo = QtWidgets.QComboBox()
         self.voice_combo.setToolTip("Choose a specific voice for the selected TTS provider")
         self.voice_combo.currentTextChanged.connect(self._on_voice_changed)
-        gl.addWidget(self.voice_combo, 3, 1, 1, 3)
-        self._voice_map: Dict[str, str] = {}
+        gl.addWidget(self.voice_combo, 3, 1, 1, 2)
+        self.refresh_voices_btn = QtWidgets.QPushButton("&Refresh Voices")
+        self.refresh_voices_btn.setToolTip("Discard cached voice lists and fetch them again")
+        self.refresh_voices_btn.clicked.connect(self._on_refresh_voices)
+        gl.addWidget(self.refresh_voices_btn, 3, 3)
+        self._voice_worker: Optional[VoiceListWorker] = None
+        self._voice_list_key: Optional[tuple] = None  # provider/credentials the combo was built for
         
         # Row 4: Summary Interval & Controls
         gl.addWidget(QtWidgets.QLabel("Summary &Interval (min):"), 4, 0)
@@ -620,6 +1049,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.summary_interval.setRange(1, 120)
         self.summary_interval.setValue(int(self.cfg.get("summary_interval_minutes", 5)))
         self.summary_interval.valueChanged.connect(self._update_cfg)
+        self.summary_interval.valueChanged.connect(self._on_summary_interval_changed)
         self.summary_interval.setToolTip("How often to automatically generate a summary (in minutes)")
         gl.addWidget(self.summary_interval, 4, 1)
 
@@ -639,11 +1069,17 @@ class MainWindow(QtWidgets.QMainWindow):
         # Row 6: Chat History (QListWidget)
         self.chat_view = QtWidgets.QListWidget()
         self.chat_view.setWordWrap(True)
+        self._pending_lines: List[str] = []
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_chat_lines)
         gl.addWidget(self.chat_view, 6, 0, 1, 4)
 
-        self.summary_timer = QtCore.QTimer(self)
-        self.summary_timer.timeout.connect(self._maybe_do_summary)
-        self.summary_timer.start(5000)
+        # Fires once per summary interval while chat is running, instead of polling
+        self._summary_timer = QtCore.QTimer(self)
+        self._summary_timer.setSingleShot(False)
+        self._summary_timer.setInterval(max(1, int(self.summary_interval.value())) * 60_000)
+        self._summary_timer.timeout.connect(self._do_summary_tick)
 
         self._setup_statusbar()
         self._update_ui_state()
@@ -689,49 +1125,97 @@ class MainWindow(QtWidgets.QMainWindow):
             rect = self.geometry()
         self.cfg["window_x"], self.cfg["window_y"] = rect.x(), rect.y()
         self.cfg["window_w"], self.cfg["window_h"] = rect.width(), rect.height()
-        save_config(self.cfg)
+        self._schedule_save()
 
     def closeEvent(self, event):
         self._on_stop(silent=True)
+        if self._summary_worker is not None:
+            # The stream loop checks for interruption between chunks and the request has
+            # a 30s timeout, so this wait is bounded.
+            self._summary_worker.requestInterruption()
+            self._summary_worker.wait()
+        self.tts.shutdown()
         self._save_window_geometry()
+        self._flush_config()
         super().closeEvent(event)
 
+    def _schedule_save(self):
+        self._cfg_dirty = True
+        self._save_timer.start(500)
+
+    def _flush_config(self):
+        self._save_timer.stop()
+        if self._cfg_dirty:
+            self._cfg_dirty = False
+            save_config(self.cfg)
+
+    def _on_summary_interval_changed(self, val: int):
+        self._summary_timer.setInterval(max(1, val) * 60_000)
+
+    def _on_chat_mode_changed(self, idx: int):
+        self._chat_mode_idx = idx
+
     def _update_cfg(self, *_):
         self.cfg["chat_mode"] = self.chat_mode.currentText()
-        self.cfg["tts_option"] = self.tts_option.currentText()
         self.cfg["summary_interval_minutes"] = int(self.summary_interval.value())
-        save_config(self.cfg)
+        self._schedule_save()
 
     def _on_tts_option_changed(self, txt: str):
         self.cfg["tts_option"] = txt
         self.cfg["tts_voice"] = ""
-        save_config(self.cfg)
-        self.tts = TTSManager(self.cfg)
+        self._schedule_save()
+        self.tts.update_config(self.cfg)
         self._update_ui_state()
         self._reload_voice_list()
 
     def _on_system_tts_changed(self, txt: str):
         self.cfg["system_tts_backend"] = txt
-        save_config(self.cfg)
-        self.tts = TTSManager(self.cfg)
+        self._schedule_save()
+        self.tts.update_config(self.cfg)
         self._update_ui_state()
         self._reload_voice_list()
 
     def _on_voice_changed(self, display: str):
         if not display or display.startswith("("):
             return
-        internal_id = self._voice_map.get(display, display)
+        internal_id = self.voice_combo.currentData() or display
         self.cfg["tts_voice"] = internal_id
-        save_config(self.cfg)
+        self._schedule_save()
+
+    @staticmethod
+    def _pending_maxlen(quick_summary_count: int) -> int:
+        return max(1000, quick_summary_count * 4)
 
     def _on_quick_summary_count_changed(self, val: int):
         self.cfg["quick_summary_count"] = val
-        save_config(self.cfg)
+        maxlen = self._pending_maxlen(val)
+        if maxlen != self.pending_messages.maxlen:
+            self.pending_messages = collections.deque(self.pending_messages, maxlen=maxlen)
+        self._schedule_save()
 
     def _add_chat_item(self, text: str):
-        item = QtWidgets.QListWidgetItem(text)
-        self.chat_view.addItem(item)
-        self.chat_view.scrollToBottom()
+        self._add_chat_items([text])
+
+    def _add_chat_items(self, texts: List[str]):
+        # Coalesce into one list update per ~50ms frame rather than one per message
+        self._pending_lines.extend(texts)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start(50)
+
+    def _flush_chat_lines(self):
+        if not self._pending_lines:
+            return
+        lines, self._pending_lines = self._pending_lines, []
+        self.chat_view.setUpdatesEnabled(False)
+        try:
+            self.chat_view.addItems(lines)
+            # Keep history bounded on long streams; drop the oldest rows in one call
+            overflow = self.chat_view.count() - CHAT_HISTORY_MAX
+            if overflow > 0:
+                self.chat_view.model().removeRows(0, overflow)
+            self.chat_view.scrollToBottom()
+        finally:
+            self.chat_view.setUpdatesEnabled(True)
 
     def _update_ui_state(self):
         is_system_tts = self.tts_option.currentText() == TTS_OPTIONS[0]
@@ -739,76 +1223,63 @@ class MainWindow(QtWidgets.QMainWindow):
         is_sapi_selected = is_system_tts and self.system_tts_mode.currentText().startswith("SAPI5")
         self.voice_combo.setEnabled(is_sapi_selected or not is_system_tts)
 
-    def _reload_voice_list(self):
-        self.voice_combo.blockSignals(True)
-        self.voice_combo.clear()
-        self._voice_map = {}
+    def _reload_voice_list(self, force: bool = False):
         opt = self.tts_option.currentText()
-        
-        voices = []
-        if opt == "System (screen reader/SAPI5)":
-            if self.system_tts_mode.currentText().startswith("SAPI5") and sys.platform.startswith("win"):
-                voices = TTSManager.list_sapi5_voices()
-                if not voices: self.voice_combo.addItem("(No SAPI5 voices found)")
-            else:
-                self.voice_combo.addItem("(Voice controlled by screen reader)")
-        elif opt == "OpenAI TTS":
-            voices = list_openai_tts_voices()
-        elif opt == "Google Cloud TTS":
-            key = self.cfg.get("google_cloud_tts_api_key", "")
-            if key:
-                items = list_gcloud_tts_voices(key)
-                if items:
-                    for name, langs in items:
-                        disp = f"{name} [{langs}]"
-                        self.voice_combo.addItem(disp)
-                        self._voice_map[disp] = name
-                else: self.voice_combo.addItem("(No voices found; check API key)")
-            else: self.voice_combo.addItem("(API key required in Options)")
-        elif opt == "Amazon Polly":
-            items = list_polly_voices(
-                self.cfg.get("aws_access_key_id", ""),
-                self.cfg.get("aws_secret_access_key", ""),
-                self.cfg.get("aws_region", "us-east-1"),
-            )
-            if items: voices = items
-            else: self.voice_combo.addItem("(AWS keys/region required in Options)")
-        elif opt == "ElevenLabs":
-            key = self.cfg.get("elevenlabs_api_key", "")
-            if key:
-                pairs = list_elevenlabs_voices(key)
-                if pairs:
-                    for name, vid in pairs:
-                        self.voice_combo.addItem(name)
-                        self._voice_map[name] = vid
-                else: self.voice_combo.addItem("(No voices found; check API key)")
-            else: self.voice_combo.addItem("(API key required in Options)")
-        else:
-            self.voice_combo.addItem("(Select a TTS provider)")
-
-        if voices:
-            self.voice_combo.addItems(voices)
+        key = (
+            opt,
+            self.cfg.get("google_cloud_tts_api_key", ""),
+            self.cfg.get("aws_access_key_id", ""),
+            self.cfg.get("aws_secret_access_key", ""),
+            self.cfg.get("aws_region", ""),
+            self.cfg.get("elevenlabs_api_key", ""),
+            self.system_tts_mode.currentText(),
+        )
+        if not force and key == self._voice_list_key and self.voice_combo.count() > 0:
+            return
+        self._voice_list_key = key
+        if self._voice_worker is not None:
+            # Can't interrupt a blocking COM/HTTP call; just drop its result.
+            try:
+                self._voice_worker.voices_ready.disconnect(self._on_voices_ready)
+            except (TypeError, RuntimeError):
+                pass
+        with QtCore.QSignalBlocker(self.voice_combo):
+            self.voice_combo.clear()
+            self.voice_combo.addItem("(Loading…)")
+        self.voice_combo.setEnabled(False)
+        worker = VoiceListWorker(self.cfg.copy(), opt, self.system_tts_mode.currentText())
+        worker.voices_ready.connect(self._on_voices_ready)
+        self._voice_worker = worker
+        worker.start()
+
+    def _on_refresh_voices(self):
+        clear_voice_cache()
+        self._reload_voice_list(force=True)
+
+    def _on_voices_ready(self, opt: str, items: List[tuple[str, Optional[str]]]):
+        if opt != self.tts_option.currentText():
+            return  # provider changed while this list was loading
+        self._voice_worker = None
+        with QtCore.QSignalBlocker(self.voice_combo):
+            self.voice_combo.clear()
+            for display, voice_id in items:
+                self.voice_combo.addItem(display, voice_id)
             current_voice = self.cfg.get("tts_voice", "")
             if current_voice:
-                if current_voice in voices:
-                    self.voice_combo.setCurrentText(current_voice)
-                else: # Check display names in voice map
-                    for disp, internal_id in self._voice_map.items():
-                        if internal_id == current_voice:
-                            self.voice_combo.setCurrentText(disp)
-                            break
-        
-        self.voice_combo.blockSignals(False)
+                idx = self.voice_combo.findData(current_voice)
+                if idx >= 0:
+                    self.voice_combo.setCurrentIndex(idx)
         self._update_ui_state()
 
     def open_options(self):
         dlg = OptionsDialog(self.cfg, self)
         if dlg.exec():
             self.cfg = dlg.get_updated_config()
-            save_config(self.cfg)
-            self.tts = TTSManager(self.cfg)
-            self.sound_manager = SoundManager(self.cfg)
-            self.summarizer = Summarizer(self.cfg)
+            self._cfg_dirty = True
+            self._flush_config()
+            self.tts.update_config(self.cfg)
+            self.sound_manager.update_config(self.cfg)
+            self.summarizer.update_config(self.cfg)
             self._reload_voice_list()
             QtWidgets.QMessageBox.information(self, APP_NAME, "Options saved and applied.")
 
@@ -823,7 +1294,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.statusBar().showMessage("Connecting to chat...")
         
         self.reader = ChatReader(vid)
-        self.reader.message_received.connect(self._on_message)
+        self.reader.messages_received_batch.connect(self._on_messages)
         self.reader.error_message.connect(self._on_error)
         self.reader.stopped.connect(self._on_stopped)
         self.reader.start()
@@ -832,7 +1303,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.stop_btn.setEnabled(True)
         self.url_edit.setEnabled(False)
         self.pending_messages.clear()
-        self.last_summary_ts = time.time()
+        self._summary_timer.start()
 
     def _on_stop(self, silent=False):
         if self.reader:
@@ -841,9 +1312,11 @@ class MainWindow(QtWidgets.QMainWindow):
             self.reader.stop()
             self.reader.wait(2000)
             self.reader = None
+        self._flush_config()
         self._on_stopped()
 
     def _on_stopped(self):
+        self._summary_timer.stop()
         if not self.start_btn.isEnabled():
             self._add_chat_item("[System] Chat stopped.")
             self.statusBar().showMessage("Disconnected.")
@@ -851,21 +1324,40 @@ class MainWindow(QtWidgets.QMainWindow):
         self.stop_btn.setEnabled(False)
         self.url_edit.setEnabled(True)
 
-    def _on_message(self, msg: Dict[str, Any]):
-        author, text = msg.get("author", "?"), msg.get("text", "")
-        self.pending_messages.append(msg)
-        
-        line = f"{author}: {text}"
-        if self.chat_mode.currentText() == CHAT_MODES[0]:
-            self._add_chat_item(line)
-            self.tts.speak(line)
-            # Play sounds
-            if msg.get("type") in ["superChat", "superSticker"]: self.sound_manager.play("donation")
-            elif msg.get("is_moderator"): self.sound_manager.play("moderator")
-            elif msg.get("is_verified"): self.sound_manager.play("verified")
-            else: self.sound_manager.play("chat")
+    def _on_messages(self, batch: List[Dict[str, Any]]):
+        self.pending_messages.extend(batch)
+        standard = self._chat_mode_idx == 0
+        lines: List[str] = []
+        for msg in batch:
+            line = msg["display"]
+            if standard:
+                lines.append(line)
+                self._speak_throttled(line, priority=msg["sound"] != "chat")
+                self._play_message_sound(msg["sound"])
+            else:
+                lines.append(f"[msg] {line}")
+        self._add_chat_items(lines)
+
+    def _play_message_sound(self, sound: str):
+        # Overlapping chat blips during a burst are just noise; donation/moderator/verified always play
+        if sound == "chat":
+            now = time.monotonic()
+            if now - self._last_chat_sound < int(self.cfg.get("chat_sound_min_interval_ms", 150)) / 1000:
+                return
+            self._last_chat_sound = now
+        self.sound_manager.play(sound)
+
+    def _speak_throttled(self, line: str, priority: bool = False):
+        # Drop ordinary chat while TTS is behind so it doesn't read stale messages.
+        # Donations, moderators, verified users and summaries are always read, but
+        # make room by dropping the oldest queued lines so speech can't fall minutes behind.
+        limit = int(self.cfg.get("tts_max_backlog", 5))
+        if not priority:
+            if self.tts.backlog() >= limit:
+                return
         else:
-            self._add_chat_item(f"[msg] {line}")
+            self.tts.trim_backlog(limit - 1)
+        self.tts.speak(line)
 
     def _on_error(self, err: str):
         self.sound_manager.play("error")
@@ -882,34 +1374,46 @@ class MainWindow(QtWidgets.QMainWindow):
             self.tts.speak(msg)
             return
         
-        self.sound_manager.play("summary")
+        if self._summary_worker is not None:
+            self.statusBar().showMessage("A summary is already being generated.", 5000)
+            return
         count = int(self.quick_summary_count_sb.value())
-        recent = self.pending_messages[-count:]
-        summary = self.summarizer.summarize(recent)
+        recent = list(itertools.islice(self.pending_messages, max(0, len(self.pending_messages) - count), None))
+        self._start_summary(recent)
+
+    def _start_summary(self, messages: List[Dict[str, str]]):
+        self.sound_manager.play("summary")
+        self.statusBar().showMessage("Generating summary…")
+        worker = SummaryWorker(self.summarizer, messages, self)
+        worker.chunk.connect(self._on_summary_chunk)
+        worker.done.connect(self._on_summary_done)
+        worker.finished.connect(worker.deleteLater)
+        self._summary_worker = worker
+        worker.start()
+
+    def _on_summary_chunk(self, sentence: str):
+        self._speak_throttled(sentence, priority=True)
+
+    def _on_summary_done(self, summary: str):
+        self._summary_worker = None
+        self.statusBar().clearMessage()
         self._add_chat_item(f"[Summary] {summary}")
-        self.tts.speak(summary)
 
     def _on_test_tts(self):
-        provider = self.cfg.get("tts_option")
+        text = f"This is a {self.cfg.get('tts_option', TTS_OPTIONS[0])} test."
         voice = self.cfg.get("tts_voice", "")
-        parts = [f"This is a {provider} test."]
-        if voice: parts.append(f"Selected voice: {voice.split(' ')[0]}")
-        text = " ".join(parts)
+        if voice: text += f" Selected voice: {voice.split(' ')[0]}"
         self._add_chat_item(f"[TTS] {text}")
         self.tts.speak(text)
 
-    def _maybe_do_summary(self):
-        if self.chat_mode.currentText() != CHAT_MODES[1] or not self.reader:
+    def _do_summary_tick(self):
+        if self._chat_mode_idx != 1 or not self.reader or not self.pending_messages:
             return
-        mins = max(1, int(self.summary_interval.value()))
-        if (time.time() - self.last_summary_ts) >= mins * 60 and self.pending_messages:
-            self.sound_manager.play("summary")
-            msgs_to_summarize = self.pending_messages.copy()
-            self.pending_messages.clear()
-            self.last_summary_ts = time.time()
-            summary = self.summarizer.summarize(msgs_to_summarize)
-            self._add_chat_item(f"[Summary] {summary}")
-            self.tts.speak(summary)
+        if self._summary_worker is not None:
+            return  # previous summary still running; these messages roll into the next one
+        msgs_to_summarize = list(self.pending_messages)
+        self.pending_messages.clear()
+        self._start_summary(msgs_to_summarize)
 
 # ----------------- Main entry -----------------
 def main():